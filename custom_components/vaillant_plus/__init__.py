@@ -16,10 +16,14 @@ from .const import (
     API_CLIENT,
     CONF_DID,
     CONF_TOKEN,
+    COORDINATOR,
     DISPATCHERS,
     DOMAIN,
+    EVT_DEVICE_CONNECTED,
+    EVT_DEVICE_UPDATED,
     EVT_TOKEN_UPDATED,
 )
+from .entity import VaillantCoordinator
 
 # TODO List the platforms that you want to support.
 # For your initial PR, limit it to 1 platform.
@@ -37,7 +41,7 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(
         DOMAIN,
-        {API_CLIENT: {}, DISPATCHERS: {}},
+        {API_CLIENT: {}, COORDINATOR: {}, DISPATCHERS: {}},
     )
     return True
 
@@ -72,6 +76,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unsub_stop = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_client)
     hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub_stop)
 
+    coordinator = VaillantCoordinator(hass, client)
+    hass.data[DOMAIN][COORDINATOR][entry.entry_id] = coordinator
+
+    for signal in (EVT_DEVICE_CONNECTED, EVT_DEVICE_UPDATED):
+        unsub_coordinator = async_dispatcher_connect(
+            hass, signal.format(device_id), coordinator.async_set_updated_data
+        )
+        hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub_coordinator)
+
+    # token refreshes update entry.data too, only option changes need a reload
+    options = dict(entry.options)
+
+    async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        nonlocal options
+        if entry.options != options:
+            options = dict(entry.options)
+            await async_reload_entry(hass, entry)
+
+    unsub_options = entry.add_update_listener(async_options_updated)
+    hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub_options)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     task = hass.loop.create_task(client.start())
@@ -92,6 +117,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             except:
                 pass
         hass.data[DOMAIN][API_CLIENT].pop(entry.entry_id)
+        hass.data[DOMAIN][COORDINATOR].pop(entry.entry_id, None)
 
     device_id = entry.data.get(CONF_DID)
     dispatchers = hass.data[DOMAIN][DISPATCHERS].pop(device_id)
@@ -102,3 +128,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             unsub_or_task()
 
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -11,13 +11,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .client import VaillantClient
-from .const import CONF_DID, DISPATCHERS, DOMAIN, EVT_DEVICE_CONNECTED, API_CLIENT
-from .entity import VaillantEntity
+from .const import CONF_DID, COORDINATOR, DISPATCHERS, DOMAIN
+from .entity import VaillantCoordinator, VaillantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -119,36 +118,49 @@ BINARY_SENSOR_DESCRIPTIONS = (
     ),
 )
 
+DESCRIPTION_KEYS = frozenset(
+    description.key for description in BINARY_SENSOR_DESCRIPTIONS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> bool:
     """Set up Vaillant binary sensors."""
     device_id = entry.data.get(CONF_DID)
-    client: VaillantClient = hass.data[DOMAIN][API_CLIENT][entry.entry_id]
+    coordinator: VaillantCoordinator = hass.data[DOMAIN][COORDINATOR][entry.entry_id]
+    client = coordinator.client
 
-    added_entities = []
+    added_entities: set[str] = set()
+    last_attr_keyset: frozenset[str] | None = None
 
     @callback
-    def async_new_entities(device_attrs: dict[str, Any]):
-        _LOGGER.debug(
-            "add vaillant binary sensor entities. device attrs: %s", device_attrs
-        )
-        new_entities = []
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            if (
-                description.key in device_attrs
-                and description.key not in added_entities
-            ):
-                new_entities.append(VaillantBinarySensorEntity(client, description))
-                added_entities.append(description.key)
-
-        if len(new_entities) > 0:
-            async_add_entities(new_entities)
-
-    unsub = async_dispatcher_connect(
-        hass, EVT_DEVICE_CONNECTED.format(device_id), async_new_entities
-    )
+    def async_new_entities() -> None:
+        nonlocal last_attr_keyset
+
+        device_attrs = coordinator.data
+        if not device_attrs or len(added_entities) == len(DESCRIPTION_KEYS):
+            return
+
+        # steady-state pushes carry the same attrs, nothing new to add
+        keyset = frozenset(device_attrs)
+        if keyset == last_attr_keyset:
+            return
+        last_attr_keyset = keyset
+
+        new_keys = DESCRIPTION_KEYS.intersection(keyset).difference(added_entities)
+        if len(new_keys) > 0:
+            _LOGGER.debug("add vaillant binary sensor entities: %s", new_keys)
+            added_entities.update(new_keys)
+            async_add_entities(
+                [
+                    VaillantBinarySensorEntity(client, description)
+                    for description in BINARY_SENSOR_DESCRIPTIONS
+                    if description.key in new_keys
+                ]
+            )
+
+    unsub = coordinator.async_add_listener(async_new_entities)
 
     hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub)
 
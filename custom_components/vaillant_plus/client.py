@@ -46,6 +46,10 @@ class VaillantClient:
 
         self._state = "INITED"
 
+    @property
+    def device_id(self) -> str:
+        return self._device_id
+
     @property
     def device(self) -> Device:
         return self._device
@@ -39,7 +39,7 @@ async def async_setup_entry(
     device_id = entry.data.get(CONF_DID)
     client: VaillantClient = hass.data[DOMAIN][API_CLIENT][entry.entry_id]
 
-    added_entities = []
+    added_entities: set[str] = set()
 
     @callback
     def async_new_climate(device_attrs: dict[str, Any]):
@@ -48,7 +48,7 @@ async def async_setup_entry(
             if device_attrs.get("Enabled_Heating") is not None:
                 new_devices = [VaillantClimate(client)]
                 async_add_devices(new_devices)
-                added_entities.append("climate")
+                added_entities.add("climate")
             else:
                 _LOGGER.warning(
                     "Missing required attribute to setup Vaillant Climate. skip."
@@ -5,6 +5,7 @@ import logging
 from typing import Any
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from vaillant_plus_cn_api import (
@@ -17,6 +18,7 @@ import voluptuous as vol
 from .utils import get_aiohttp_session
 from .const import (
     CONF_DID,
+    CONF_ENABLE_DEBUG_SENSORS,
     CONF_PASSWORD,
     CONF_TOKEN,
     CONF_USERNAME,
@@ -139,6 +141,37 @@ class VaillantPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="select", data_schema=select_schema, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return VaillantPlusOptionsFlow()
+
+
+class VaillantPlusOptionsFlow(config_entries.OptionsFlow):
+    """Handle Vaillant Plus options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        entry = self.hass.config_entries.async_get_entry(self.handler)
+        options_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_ENABLE_DEBUG_SENSORS,
+                    default=entry.options.get(CONF_ENABLE_DEBUG_SENSORS, False),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=options_schema)
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -3,6 +3,7 @@
 DOMAIN = "vaillant_plus"
 API_CLIENT = "client"
 DISPATCHERS = "dispatchers"
+COORDINATOR = "coordinator"
 
 
 CONF_USERNAME = "username"
@@ -14,6 +15,7 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_MAC = "mac"
 CONF_PRODUCT_NAME = "product_name"
+CONF_ENABLE_DEBUG_SENSORS = "enable_debug_sensors"
 
 EVT_DEVICE_CONNECTED = "vaillant_plus_device.{}.connected"
 EVT_DEVICE_UPDATED = "vaillant_plus_device.{}.updated"
@@ -1,12 +1,14 @@
 """Vaillant vSMART entity classes."""
+from __future__ import annotations
 
 from datetime import timedelta
 import logging
 from typing import Any
 
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity, DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from vaillant_plus_cn_api import Device
 
 from .client import VaillantClient
@@ -17,6 +19,23 @@ UPDATE_INTERVAL = timedelta(minutes=1)
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+class VaillantCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Hold the latest device attrs pushed by the Vaillant cloud.
+
+    The websocket client pushes data, so no update interval is set; the
+    coordinator is fed through async_set_updated_data instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: VaillantClient,
+    ):
+        """Initialize."""
+        super().__init__(hass, _LOGGER, name=f"{DOMAIN}_{client.device_id}")
+        self.client = client
+
+
 class VaillantEntity(Entity):
     """Base class for Vaillant entities."""
 
@@ -48,8 +67,8 @@ class VaillantEntity(Entity):
         def update(data: dict[str, Any]) -> None:
             """Update the state."""
             _LOGGER.debug("write ha state: %s", data)
-            self.update_from_latest_data(data)
-            self.async_schedule_update_ha_state()
+            if self.update_from_latest_data(data) is not False:
+                self.async_schedule_update_ha_state()
 
         self.async_on_remove(
             async_dispatcher_connect(
@@ -78,8 +97,11 @@ class VaillantEntity(Entity):
         )
 
     @callback
-    def update_from_latest_data(self, data: dict[str, Any]) -> None:
-        """Update the entity from the latest data."""
+    def update_from_latest_data(self, data: dict[str, Any]) -> bool | None:
+        """Update the entity from the latest data.
+
+        Return False when nothing changed to skip the state write.
+        """
 
     async def send_command(self, attr: str, value: Any) -> None:
         """Send operations to cloud."""
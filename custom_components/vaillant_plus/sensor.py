@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,294 +14,300 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.const import UnitOfTemperature, UnitOfPressure
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfPressure
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .client import VaillantClient
-from .const import CONF_DID, DISPATCHERS, DOMAIN, EVT_DEVICE_CONNECTED, API_CLIENT
-from .entity import VaillantEntity
+from .const import (
+    CONF_DID,
+    CONF_ENABLE_DEBUG_SENSORS,
+    COORDINATOR,
+    DISPATCHERS,
+    DOMAIN,
+)
+from .entity import VaillantCoordinator, VaillantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-SENSOR_DESCRIPTIONS = (
-    SensorEntityDescription(
-        key="Room_Temperature_Setpoint_Comfort",
+# Raw description kwargs keyed by device attr; the SensorEntityDescription is
+# only built for keys a device actually reports.
+_CORE_DESCRIPTIONS: dict[str, dict[str, Any]] = {
+    "Room_Temperature_Setpoint_Comfort": dict(
         name="CH temperature room setpoint comfort mode",
         translation_key="ch_temperature_set_room_comfort",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Room_Temperature_Setpoint_ECO",
+    "Room_Temperature_Setpoint_ECO": dict(
         name="CH temperature room setpoint ECO mode",
         translation_key="ch_temperature_set_room_eco",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Outdoor_Temperature",
+    "Outdoor_Temperature": dict(
         name="CH temperature outdoor",
         translation_key="ch_temperature_outdoor",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Room_Temperature",
+    "Room_Temperature": dict(
         name="CH temperature room",
         translation_key="ch_temperature_room",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Lower_Limitation_of_CH_Setpoint",
+    "Lower_Limitation_of_CH_Setpoint": dict(
         name="CH temperature setpoint Lower",
         translation_key="ch_temperature_set_lower",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Upper_Limitation_of_CH_Setpoint",
+    "Upper_Limitation_of_CH_Setpoint": dict(
         name="CH temperature setpoint Upper",
         translation_key="ch_temperature_set_upper",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Flow_Temperature_Setpoint",
+    "Flow_Temperature_Setpoint": dict(
         name="CH temperature flow setpoint",
         translation_key="ch_temperature_flow_set",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Flow_temperature",
+    "Flow_temperature": dict(
         name="temperature flow current",
         translation_key="temperature_flow_current",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="return_temperature",
+    "return_temperature": dict(
         name="temperature flow return",
         translation_key="temperature_flow_return",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Tank_temperature",
+    "Tank_temperature": dict(
         name="Water tank temperature",
         translation_key="temperature_tank",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="DHW_setpoint",
+    "DHW_setpoint": dict(
         name="DHW temperature setpoint",
         translation_key="dhw_temperature_set",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Lower_Limitation_of_DHW_Setpoint",
+    "Lower_Limitation_of_DHW_Setpoint": dict(
         name="DHW temperature setpoint Lower",
         translation_key="dhw_temperature_set_lower",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Upper_Limitation_of_DHW_Setpoint",
+    "Upper_Limitation_of_DHW_Setpoint": dict(
         name="DHW temperature setpoint Upper",
         translation_key="dhw_temperature_set_upper",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Current_DHW_Setpoint",
+    "Current_DHW_Setpoint": dict(
         name="DHW temperature sepoint Current",
         translation_key="dhw_temperature_set_current",
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="Heating_System_Setting",
+    "Heating_System_Setting": dict(
         name="CH Heating System Setting",
         translation_key="ch_heating_system_setting",
     ),
-    SensorEntityDescription(
-        key="Time_slot_type",
+    "Time_slot_type": dict(
         name="Time Slot Type",
         translation_key="time_slot_type",
     ),
-    SensorEntityDescription(
-        key="Slot_current_CH",
+    "Slot_current_CH": dict(
         name="CH Slot Current",
         translation_key="ch_slot_current",
     ),
-    SensorEntityDescription(
-        key="Slot_current_DHW",
+    "Slot_current_DHW": dict(
         name="DHW Slot Current",
         translation_key="dhw_slot_current",
     ),
-    SensorEntityDescription(
-        key="Heating_Curve",
+    "Heating_Curve": dict(
         name="CH Heating Curve",
         translation_key="ch_heating_curve",
     ),
-    SensorEntityDescription(
-        key="Mode_Setting_DHW",
+    "Mode_Setting_DHW": dict(
         name="DHW Mode Setting",
         translation_key="dhw_mode_setting",
     ),
-    SensorEntityDescription(
-        key="Mode_Setting_CH",
+    "Mode_Setting_CH": dict(
         name="CH Mode Setting",
         translation_key="ch_mode_setting",
     ),
-    SensorEntityDescription(
-        key="DHW_Function",
+    "DHW_Function": dict(
         name="DHW Function",
         translation_key="dhw_function",
     ),
-    SensorEntityDescription(
-        key="Max_NumBer_Of_Timeslots_CH",
+    "Max_NumBer_Of_Timeslots_CH": dict(
         name="CH Max Timeslots",
         translation_key="ch_max_timeslots",
     ),
-    SensorEntityDescription(
-        key="Max_NumBer_Of_Timeslots_DHW",
+    "Max_NumBer_Of_Timeslots_DHW": dict(
         name="DHW Max Timeslots",
         translation_key="dhw_max_timeslots",
     ),
-    SensorEntityDescription(
-        key="reserved_data1",
+    "reserved_data1": dict(
         name="CH Water Pressure",
         translation_key="ch_water_pressure",
         device_class=SensorDeviceClass.PRESSURE,
         unit_of_measurement=UnitOfPressure.BAR,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
-        key="reserved_data2",
-        name="Reserved data2",
-        translation_key="reserved_data2",
-    ),
-    SensorEntityDescription(
-        key="reserved_data3",
-        name="Reserved data3",
-        translation_key="reserved_data3",
-    ),
-    SensorEntityDescription(
-        key="Fault_List",
+    "Fault_List": dict(
         name="Fault List",
         translation_key="fault_list",
     ),
-    SensorEntityDescription(
-        key="Maintenance",
-        name="Maintenance",
-        translation_key="maintenance",
-    ),
-    SensorEntityDescription(
-        key="Brand",
+    "Brand": dict(
         name="Brand",
         translation_key="brand",
     ),
-    SensorEntityDescription(
-        key="DSN",
+    "DSN": dict(
         name="DSN",
         translation_key="dsn",
     ),
-    SensorEntityDescription(
-        key="WarmStar_Tank_Loading_Enable",
+    "WarmStar_Tank_Loading_Enable": dict(
         name="WarmStar_Tank_Loading_Enable",
         translation_key="warmstar_tank_loading_enable",
     ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW1",
+    # "Start_Time_DHW1": dict(
     #     name="DHW Time1 Monday",
     #     translation_key="dhw_start_time1",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW2",
+    # "Start_Time_DHW2": dict(
     #     name="DHW Time2 Tuesday",
     #     translation_key="dhw_start_time2",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW3",
+    # "Start_Time_DHW3": dict(
     #     name="DHW Time3 Wednesday",
     #     translation_key="dhw_start_time3",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW4",
+    # "Start_Time_DHW4": dict(
     #     name="DHW Time4 Thursday",
     #     translation_key="dhw_start_time4",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW5",
+    # "Start_Time_DHW5": dict(
     #     name="DHW Time5 Friday",
     #     translation_key="dhw_start_time5",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW6",
+    # "Start_Time_DHW6": dict(
     #     name="DHW Time6 Saturday",
     #     translation_key="dhw_start_time6",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_DHW7",
+    # "Start_Time_DHW7": dict(
     #     name="DHW Time7 Sunday",
     #     translation_key="dhw_start_time7",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH1",
+    # "Start_Time_CH1": dict(
     #     name="CH Time1 Monday",
     #     translation_key="ch_start_time1",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH2",
+    # "Start_Time_CH2": dict(
     #     name="CH Time2 Tuesday",
     #     translation_key="ch_start_time2",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH3",
+    # "Start_Time_CH3": dict(
     #     name="CH Time3 Wednesday",
     #     translation_key="ch_start_time3",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH4",
+    # "Start_Time_CH4": dict(
     #     name="CH Time4 Thursday",
     #     translation_key="ch_start_time4",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH5",
+    # "Start_Time_CH5": dict(
     #     name="CH Time5 Friday",
     #     translation_key="ch_start_time5",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH6",
+    # "Start_Time_CH6": dict(
     #     name="CH Time6 Saturday",
     #     translation_key="ch_start_time6",
     # ),
-    # SensorEntityDescription(
-    #     key="Start_Time_CH7",
+    # "Start_Time_CH7": dict(
     #     name="CH Time7 Sunday",
     #     translation_key="ch_start_time7",
     # ),
-)
+}
+
+# Untyped pass-through attrs, only added when enabled in the entry options.
+_DEBUG_DESCRIPTIONS: dict[str, dict[str, Any]] = {
+    "reserved_data2": dict(
+        name="Reserved data2",
+        translation_key="reserved_data2",
+    ),
+    "reserved_data3": dict(
+        name="Reserved data3",
+        translation_key="reserved_data3",
+    ),
+    "Maintenance": dict(
+        name="Maintenance",
+        translation_key="maintenance",
+    ),
+}
+
+SENSOR_DESCRIPTIONS = {**_CORE_DESCRIPTIONS, **_DEBUG_DESCRIPTIONS}
+
+CORE_DESCRIPTION_KEYS = frozenset(_CORE_DESCRIPTIONS)
+DESCRIPTION_KEYS = frozenset(SENSOR_DESCRIPTIONS)
+
+
+@functools.cache
+def _get_description(key: str) -> SensorEntityDescription:
+    """Build the sensor description for a device attr on first use."""
+    return SensorEntityDescription(key=key, **SENSOR_DESCRIPTIONS[key])
+
+
+def _hex_to_bar(value: Any) -> float | None:
+    """Convert the hex encoded water pressure into bar."""
+    try:
+        return int(value, 16) / 10.0
+    except (ValueError, TypeError):
+        _LOGGER.warning("Invalid water pressure value: %s", value)
+        return None
+
+
+_TRANSFORMS: dict[str, Callable[[Any], Any]] = {
+    # 处理 Tank_temperature，可能为华氏度，直接转换为摄氏度
+    "Tank_temperature": lambda value: (value - 32) * 5 / 9,
+    # 处理 水压，十六进制转换为Bar
+    "reserved_data1": _hex_to_bar,
+}
+
+
+@callback
+def _async_remove_debug_sensors(hass: HomeAssistant, device_id: str) -> None:
+    """Remove debug sensors left in the registry while the option is off."""
+    entity_registry = er.async_get(hass)
+    for key in _DEBUG_DESCRIPTIONS:
+        entity_id = entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{device_id}_{key}"
+        )
+        if entity_id is not None:
+            _LOGGER.debug("remove disabled debug sensor: %s", entity_id)
+            entity_registry.async_remove(entity_id)
 
 
 async def async_setup_entry(
@@ -308,28 +315,52 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Vaillant sensors."""
     device_id = entry.data.get(CONF_DID)
-    client: VaillantClient = hass.data[DOMAIN][API_CLIENT][entry.entry_id]
+    coordinator: VaillantCoordinator = hass.data[DOMAIN][COORDINATOR][entry.entry_id]
+
+    if entry.options.get(CONF_ENABLE_DEBUG_SENSORS, False):
+        description_keys = DESCRIPTION_KEYS
+    else:
+        description_keys = CORE_DESCRIPTION_KEYS
+        # drop the entries created by earlier versions or before the option
+        # was turned off, they would otherwise stay around as unavailable
+        _async_remove_debug_sensors(hass, device_id)
 
-    added_entities = []
+    added_entities: set[str] = set()
+    last_attr_keyset: frozenset[str] | None = None
+
+    async def async_add_new_entities(new_keys: frozenset[str]) -> None:
+        _LOGGER.debug("add vaillant sensor entities: %s", new_keys)
+        async_add_entities(
+            [
+                VaillantSensorEntity(coordinator, _get_description(key))
+                for key in SENSOR_DESCRIPTIONS
+                if key in new_keys
+            ]
+        )
 
     @callback
-    def async_new_entities(device_attrs: dict[str, Any]):
-        _LOGGER.debug("add vaillant sensor entities. device attrs: %s", device_attrs)
-        new_entities = []
-        for description in SENSOR_DESCRIPTIONS:
-            if (
-                description.key in device_attrs
-                and description.key not in added_entities
-            ):
-                new_entities.append(VaillantSensorEntity(client, description))
-                added_entities.append(description.key)
-
-        if len(new_entities) > 0:
-            async_add_entities(new_entities)
-
-    unsub = async_dispatcher_connect(
-        hass, EVT_DEVICE_CONNECTED.format(device_id), async_new_entities
-    )
+    def async_new_entities() -> None:
+        nonlocal last_attr_keyset
+
+        device_attrs = coordinator.data
+        if not device_attrs:
+            return
+
+        # steady-state pushes carry the same attrs, nothing new to add
+        keyset = frozenset(device_attrs)
+        if keyset == last_attr_keyset:
+            return
+        last_attr_keyset = keyset
+
+        new_keys = description_keys.intersection(device_attrs).difference(
+            added_entities
+        )
+        if len(new_keys) > 0:
+            added_entities.update(new_keys)
+            # build entities outside the listener so other listeners aren't held up
+            entry.async_create_task(hass, async_add_new_entities(new_keys))
+
+    unsub = coordinator.async_add_listener(async_new_entities)
 
     hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub)
 
@@ -339,33 +370,45 @@ async def async_setup_entry(
 class VaillantSensorEntity(VaillantEntity, SensorEntity):
     """Define a Vaillant sensor entity."""
 
+    __slots__ = ("_key", "_transform", "coordinator")
+
     def __init__(
         self,
-        client: VaillantClient,
+        coordinator: VaillantCoordinator,
         description: SensorEntityDescription,
     ):
-        super().__init__(client)
+        super().__init__(coordinator.client)
+        self.coordinator = coordinator
         self.entity_description = description
+        self._key = description.key
+        self._transform = _TRANSFORMS.get(description.key)
+        self._attr_unique_id = f"{self.device.id}_{description.key}"
         # set native_unit_of_measurement
         self._attr_native_unit_of_measurement = description.unit_of_measurement
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self.device.id}_{self.entity_description.key}"
+    async def async_added_to_hass(self) -> None:
+        """Register coordinator listener."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+        if self.coordinator.data:
+            self.update_from_latest_data(self.coordinator.data)
 
     @callback
-    def update_from_latest_data(self, data: dict[str, Any]) -> None:
-        """Update the entity from the latest data."""
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # skip the state write when the pushed value didn't change
+        if self.update_from_latest_data(self.coordinator.data):
+            self.async_write_ha_state()
 
-        value = data.get(self.entity_description.key)
-        # 处理 Tank_temperature，可能为华氏度，直接转换为摄氏度
-        if self.entity_description.key == "Tank_temperature" and value is not None:
-            value = (value - 32) * 5 / 9
+    @callback
+    def update_from_latest_data(self, data: dict[str, Any]) -> bool:
+        """Update the entity from the latest data."""
 
-        # 处理 水压，十六进制转换为Bar
-        if self.entity_description.key == "reserved_data1" and value is not None:
-            value = int(value, 16) / 10.0
+        value = data.get(self._key)
+        if value is not None and self._transform is not None:
+            value = self._transform(value)
 
         # 以下功能已使用text entity: text.py 替代，实现修改和控制定时功能
         #
@@ -403,5 +446,9 @@ class VaillantSensorEntity(VaillantEntity, SensorEntity):
         #         )
         #         value = None
 
+        available = value is not None
+        if value == self._attr_native_value and available == self._attr_available:
+            return False
         self._attr_native_value = value
-        self._attr_available = value is not None
+        self._attr_available = available
+        return True
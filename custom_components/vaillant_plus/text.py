@@ -8,18 +8,19 @@ The code encodes/decodes to/from the device 24-character hex format
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from typing import Any, List, Tuple
 
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .client import VaillantClient
-from .const import CONF_DID, DISPATCHERS, DOMAIN, EVT_DEVICE_CONNECTED, API_CLIENT
-from .entity import VaillantEntity
+from .const import CONF_DID, COORDINATOR, DISPATCHERS, DOMAIN
+from .entity import VaillantCoordinator, VaillantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +34,20 @@ CH_START_KEYS = [
     ("Start_Time_CH6", "CH Start Time 6"),
     ("Start_Time_CH7", "CH Start Time 7"),
 ]
+_CH_START_KEY_SET = frozenset(key for key, _ in CH_START_KEYS)
+_CH_NAME_BY_KEY = dict(CH_START_KEYS)
+
+# Writes from all start-time entities within this window are sent together
+WRITE_COALESCE_DELAY = 0.2
+
+# Zero-padded 2-digit lookup tables, cheaper than formatting on every call.
+# _DEC2 covers every byte value since device data isn't range checked.
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+_DEC2 = tuple(f"{i:02d}" for i in range(256))
+
+# One "HH:MM-HH:MM" slot; like int() on the split parts, whitespace is allowed
+# around every number and leading zeros are accepted
+_SLOT_RE = re.compile(r"\s*(\d+)\s*:\s*(\d+)\s*-\s*(\d+)\s*:\s*(\d+)\s*")
 
 
 def encode_timeslots_from_list(slots: List[Tuple[int, int, int, int]]) -> str:
@@ -49,51 +64,124 @@ def encode_timeslots_from_list(slots: List[Tuple[int, int, int, int]]) -> str:
             eh = max(0, min(23, int(eh)))
             sm = max(0, min(59, int(sm)))
             em = max(0, min(59, int(em)))
-            parts.append(f"{sh:02X}{sm:02X}{eh:02X}{em:02X}")
+            parts.append(_HEX2[sh] + _HEX2[sm] + _HEX2[eh] + _HEX2[em])
         else:
             parts.append("00000000")
     return "".join(parts)
 
 
-def parse_display_string_to_slots(display: str) -> List[Tuple[int, int, int, int]]:
+def parse_display_string_to_slots(
+    display: str,
+) -> Tuple[List[Tuple[int, int, int, int]], str]:
     """Parse a display string like '07:00-09:00, 18:00-22:00' into list of tuples.
-    Returns up to 3 tuples. If display is '0' or empty -> empty list.
+    Returns up to 3 tuples plus the canonical display string ('07:00-09:00, ...').
+    If display is '0' or empty -> empty list and '0'.
     Raises ValueError on malformed input.
     """
     if display is None:
-        return []
+        return [], "0"
     s = display.strip()
     if s == "" or s == "0" or s.lower() in ("none", "null"):
-        return []
+        return [], "0"
 
-    parts = [p.strip() for p in s.split(",") if p.strip()]
+    parts = [p for p in s.split(",") if p and not p.isspace()]
     slots: List[Tuple[int, int, int, int]] = []
+    formatted_times: List[str] = []
     for p in parts[:3]:
-        if "-" not in p:
-            raise ValueError(f"invalid timeslot (missing '-'): {p}")
-        start, end = p.split("-", 1)
-        if ":" not in start or ":" not in end:
-            raise ValueError(f"invalid time format (missing ':'): {p}")
-        sh_str, sm_str = start.split(":", 1)
-        eh_str, em_str = end.split(":", 1)
-        sh = int(sh_str)
-        sm = int(sm_str)
-        eh = int(eh_str)
-        em = int(em_str)
+        m = _SLOT_RE.fullmatch(p)
+        if m is None:
+            raise ValueError(f"invalid timeslot (expected HH:MM-HH:MM): {p.strip()}")
+        sh, sm, eh, em = int(m[1]), int(m[2]), int(m[3]), int(m[4])
         if not (0 <= sh <= 23 and 0 <= eh <= 23 and 0 <= sm <= 59 and 0 <= em <= 59):
-            raise ValueError(f"time values out of range: {p}")
+            raise ValueError(f"time values out of range: {p.strip()}")
         slots.append((sh, sm, eh, em))
-    return slots
+        formatted_times.append(
+            _DEC2[sh] + ":" + _DEC2[sm] + "-" + _DEC2[eh] + ":" + _DEC2[em]
+        )
+    return slots, ", ".join(formatted_times) or "0"
+
+
+class _PendingWrites:
+    """Coalesce start-time writes of one device into a single control_device call.
+
+    Every caller queued within the delay window waits for, and gets, the result
+    of the shared call.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: VaillantClient,
+        delay: float = WRITE_COALESCE_DELAY,
+    ) -> None:
+        self._hass = hass
+        self._client = client
+        self._delay = delay
+        self._attrs: dict[str, str] = {}
+        self._future: asyncio.Future | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    async def async_send(self, key: str, value: str) -> bool | None:
+        """Queue a write and wait for the batched control_device result."""
+        self._attrs[key] = value
+        if self._future is None:
+            self._future = self._hass.loop.create_future()
+            self._handle = self._hass.loop.call_later(self._delay, self._flush)
+        return await asyncio.shield(self._future)
+
+    @callback
+    def _flush(self) -> None:
+        self._handle = None
+        attrs, self._attrs = self._attrs, {}
+        future, self._future = self._future, None
+        self._hass.async_create_task(self._async_control_device(attrs, future))
+
+    async def _async_control_device(
+        self, attrs: dict[str, str], future: asyncio.Future
+    ) -> None:
+        _LOGGER.debug("Send batched start time writes: %s", attrs)
+        try:
+            resp = await self._client.control_device(attrs)
+        except Exception as exc:
+            _LOGGER.error("Exception when sending control for %s: %s", list(attrs), exc)
+            resp = None
+        if not future.done():
+            future.set_result(resp)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop queued writes."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self._attrs = {}
 
 
 class VaillantTimeTextEntity(VaillantEntity, TextEntity):
     """Writable text entity representing a Start_Time_CHn."""
 
-    def __init__(self, client: VaillantClient, key: str, name: str):
+    def __init__(
+        self,
+        client: VaillantClient,
+        key: str,
+        name: str,
+        pending_writes: _PendingWrites | None = None,
+    ):
         super().__init__(client)
         self._key = key
+        # writes go straight to the client when no coalescer is given
+        self._pending_writes = pending_writes
         self._attr_name = name
         self._attr_native_value: str | None = None
+        # last known device hex value, used to skip no-op decodes and writes
+        self._last_hex: str | None = None
+        # writes queued or awaiting the cloud, _last_hex is stale while > 0
+        self._writes_outstanding = 0
+        # bumped per sent write, only the latest one may update the state
+        self._write_seq = 0
         # available will be set when update_from_latest_data runs
 
     @property
@@ -101,34 +189,50 @@ class VaillantTimeTextEntity(VaillantEntity, TextEntity):
         return f"{self.device.id}_{self._key}"
 
     @callback
-    def update_from_latest_data(self, data: dict[str, Any]) -> None:
+    def update_from_latest_data(self, data: dict[str, Any]) -> bool:
         """Update display value from device data (24-char hex -> readable text)."""
         val = data.get(self._key)
+        if val is not None and val == self._last_hex:
+            return False
+
+        raw = None
         if isinstance(val, str) and len(val) == 24:
-            slots = [val[i : i + 8] for i in range(0, 24, 8)]
+            try:
+                # 12 bytes: (start_h, start_m, end_h, end_m) for each of the 3 slots
+                raw = bytes.fromhex(val)
+            except ValueError as exc:
+                _LOGGER.warning(
+                    "Failed to parse timeslots %s for %s: %s", val, self._key, exc
+                )
+            else:
+                # fromhex() skips whitespace, so the byte count isn't guaranteed
+                if len(raw) != 12:
+                    _LOGGER.warning("Invalid timeslots %s for %s", val, self._key)
+                    raw = None
+
+        if raw is not None:
             formatted_times: List[str] = []
-            for slot in slots:
-                if slot == "00000000":
+            for off in (0, 4, 8):
+                sh, sm, eh, em = raw[off], raw[off + 1], raw[off + 2], raw[off + 3]
+                if (sh | sm | eh | em) == 0:
                     continue
-                try:
-                    sh = int(slot[0:2], 16)
-                    sm = int(slot[2:4], 16)
-                    eh = int(slot[4:6], 16)
-                    em = int(slot[6:8], 16)
-                    formatted_times.append(f"{sh:02d}:{sm:02d}-{eh:02d}:{em:02d}")
-                except Exception as exc:
-                    _LOGGER.warning(
-                        "Failed to parse timeslot %s for %s: %s", slot, self._key, exc
-                    )
-                    continue
-            self._attr_native_value = (
-                ", ".join(formatted_times) if formatted_times else "0"
-            )
+                formatted_times.append(
+                    _DEC2[sh] + ":" + _DEC2[sm] + "-" + _DEC2[eh] + ":" + _DEC2[em]
+                )
+            new_value = ", ".join(formatted_times) if formatted_times else "0"
+            self._last_hex = val
+            if new_value == self._attr_native_value and self._attr_available:
+                return False
+            self._attr_native_value = new_value
             self._attr_available = True
         else:
             # if device didn't provide the key or invalid format
+            self._last_hex = None
+            if self._attr_native_value is None and not self._attr_available:
+                return False
             self._attr_native_value = None
             self._attr_available = False
+        return True
 
     async def async_set_value(self, value: str) -> None:
         """Called when the user sets the Text entity in the UI.
@@ -143,12 +247,8 @@ class VaillantTimeTextEntity(VaillantEntity, TextEntity):
             _LOGGER.error("No value provided to set for %s", self._key)
             return
 
-        display = value.strip()
         try:
-            if display == "0" or display == "":
-                slots: List[Tuple[int, int, int, int]] = []
-            else:
-                slots = parse_display_string_to_slots(display)
+            slots, canonical = parse_display_string_to_slots(value)
         except ValueError as exc:
             _LOGGER.error("Invalid time format provided for %s: %s", self._key, exc)
             return
@@ -156,26 +256,48 @@ class VaillantTimeTextEntity(VaillantEntity, TextEntity):
         hexstr = encode_timeslots_from_list(slots)
         _LOGGER.debug("Encoded %s -> %s", slots, hexstr)
 
-        try:
-            # Use same control_device API shape as in climate.py
-            resp = await self._client.control_device({self._key: hexstr})
-        except Exception as exc:
-            _LOGGER.error("Exception when sending control for %s: %s", self._key, exc)
-            resp = None
-
-        # attempt to determine success: if client returns truthy or None (some clients may not return),
-        # we'll optimistically update local state. If client explicitly returns False, log error.
-        if resp is False:
-            _LOGGER.error("Device rejected update for %s -> %s", self._key, hexstr)
-            return
+        # while an earlier write is queued or in flight the device value is
+        # about to change, so a value matching _last_hex must still be sent
+        if (
+            self._writes_outstanding == 0
+            and self._last_hex is not None
+            and hexstr == self._last_hex.upper()
+        ):
+            # device already holds this value, no need for a cloud round-trip
+            _LOGGER.debug("Skip sending unchanged %s -> %s", self._key, hexstr)
+        else:
+            self._writes_outstanding += 1
+            self._write_seq += 1
+            write_seq = self._write_seq
+            try:
+                if self._pending_writes is not None:
+                    resp = await self._pending_writes.async_send(self._key, hexstr)
+                else:
+                    # Use same control_device API shape as in climate.py
+                    resp = await self._client.control_device({self._key: hexstr})
+            except Exception as exc:
+                _LOGGER.error(
+                    "Exception when sending control for %s: %s", self._key, exc
+                )
+                resp = None
+            finally:
+                self._writes_outstanding -= 1
+
+            if write_seq != self._write_seq:
+                # a newer input was sent meanwhile and owns the displayed value
+                return
+
+            # attempt to determine success: if client returns truthy or None (some clients may not return),
+            # we'll optimistically update local state. If client explicitly returns False, log error.
+            if resp is False:
+                _LOGGER.error("Device rejected update for %s -> %s", self._key, hexstr)
+                return
+            # without a confirmed write the device value is unknown, so the
+            # next device update must be decoded again
+            self._last_hex = hexstr if resp else None
 
         # update local displayed value to reflect what we sent
-        if slots:
-            self._attr_native_value = ", ".join(
-                f"{s[0]:02d}:{s[1]:02d}-{s[2]:02d}:{s[3]:02d}" for s in slots
-            )
-        else:
-            self._attr_native_value = "0"
+        self._attr_native_value = canonical
 
         self._attr_available = True
         # push to HA state machine
@@ -187,28 +309,43 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Vaillant Start_Time_CH Text entities from a config entry."""
     device_id = entry.data.get(CONF_DID)
-    client: VaillantClient = hass.data[DOMAIN][API_CLIENT][entry.entry_id]
+    coordinator: VaillantCoordinator = hass.data[DOMAIN][COORDINATOR][entry.entry_id]
+    client = coordinator.client
+    pending_writes = _PendingWrites(hass, client)
+    hass.data[DOMAIN][DISPATCHERS][device_id].append(pending_writes.async_cancel)
 
-    added_keys: List[str] = []
+    added_keys: set[str] = set()
+    last_attr_keyset: frozenset[str] | None = None
 
     @callback
-    def async_new_time_entities(device_attrs: dict[str, Any]):
-        _LOGGER.debug(
-            "add vaillant time entities. device attrs keys: %s",
-            list(device_attrs.keys()),
-        )
-        new_entities: List[VaillantTimeTextEntity] = []
-        for key, friendly_name in CH_START_KEYS:
-            if key in device_attrs and key not in added_keys:
-                new_entities.append(VaillantTimeTextEntity(client, key, friendly_name))
-                added_keys.append(key)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    unsub = async_dispatcher_connect(
-        hass, EVT_DEVICE_CONNECTED.format(device_id), async_new_time_entities
-    )
+    def async_new_time_entities() -> None:
+        nonlocal last_attr_keyset
+
+        device_attrs = coordinator.data
+        if not device_attrs or added_keys == _CH_START_KEY_SET:
+            return
+
+        # steady-state pushes carry the same attrs, nothing new to add
+        keyset = frozenset(device_attrs)
+        if keyset == last_attr_keyset:
+            return
+        last_attr_keyset = keyset
+
+        new_keys = _CH_START_KEY_SET.intersection(keyset).difference(added_keys)
+        if new_keys:
+            _LOGGER.debug("add vaillant time entities: %s", new_keys)
+            added_keys.update(new_keys)
+            # sorted to keep the Mon..Sun order
+            async_add_entities(
+                [
+                    VaillantTimeTextEntity(
+                        client, key, _CH_NAME_BY_KEY[key], pending_writes
+                    )
+                    for key in sorted(new_keys)
+                ]
+            )
+
+    unsub = coordinator.async_add_listener(async_new_time_entities)
     hass.data[DOMAIN][DISPATCHERS][device_id].append(unsub)
 
     return True
@@ -47,7 +47,7 @@ async def async_setup_entry(
     device_id = entry.data.get(CONF_DID)
     client: VaillantClient = hass.data[DOMAIN][API_CLIENT][entry.entry_id]
 
-    added_entities = []
+    added_entities: set[str] = set()
 
     @callback
     def async_new_water_heater(device_attrs: dict[str, Any]):
@@ -56,7 +56,7 @@ async def async_setup_entry(
             if device_attrs.get("DHW_setpoint") is not None:
                 new_devices = [VaillantWaterHeater(client)]
                 async_add_devices(new_devices)
-                added_entities.append("water_heater")
+                added_entities.add("water_heater")
             else:
                 _LOGGER.warning(
                     "Missing required attribute to setup Vaillant Water Heater. skip."
@@ -2,11 +2,22 @@
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.helpers.entity import EntityCategory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.vaillant_plus.binary_sensor import (
     VaillantBinarySensorDescription,
     VaillantBinarySensorEntity,
+    async_setup_entry,
 )
+from custom_components.vaillant_plus.const import (
+    CONF_DID,
+    COORDINATOR,
+    DISPATCHERS,
+    DOMAIN,
+)
+from custom_components.vaillant_plus.entity import VaillantCoordinator
+
+from .const import MOCK_DID
 
 
 async def test_binary_sensor_heating_enabled(device_api_client):
@@ -104,3 +115,33 @@ async def test_binary_sensor_boiler_info5_bit4(device_api_client):
 
     binary_sensor.update_from_latest_data({"Boiler_info5_bit4": "000"})
     assert binary_sensor.is_on is False
+
+
+async def test_binary_sensor_discovery(hass, device_api_client):
+    """Test entities are added for keys reported after the first snapshot."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_DID: MOCK_DID})
+    coordinator = VaillantCoordinator(hass, device_api_client)
+    hass.data[DOMAIN] = {
+        COORDINATOR: {entry.entry_id: coordinator},
+        DISPATCHERS: {MOCK_DID: []},
+    }
+
+    added_entities: list[VaillantBinarySensorEntity] = []
+    assert await async_setup_entry(hass, entry, added_entities.extend)
+
+    # an empty snapshot is skipped
+    coordinator.async_set_updated_data({})
+    assert added_entities == []
+
+    coordinator.async_set_updated_data({"Heating_Enable": 1, "Room_Temperature": 20})
+    assert [e.entity_description.key for e in added_entities] == ["Heating_Enable"]
+
+    # keys missing from the first snapshot get their entities later
+    coordinator.async_set_updated_data(
+        {"RF_Status": 3, "Heating_Enable": 1, "Circulation_Enable": 0}
+    )
+    assert [e.entity_description.key for e in added_entities] == [
+        "Heating_Enable",
+        "Circulation_Enable",
+        "RF_Status",
+    ]
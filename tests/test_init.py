@@ -9,8 +9,9 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from pytest_homeassistant_custom_component.common import MockConfigEntry
-from vaillant_plus_cn_api import EVT_DEVICE_ATTR_UPDATE
+from vaillant_plus_cn_api import EVT_DEVICE_ATTR_UPDATE, Token
 
 from custom_components.vaillant_plus import (
     VaillantClient,
@@ -18,13 +19,21 @@ from custom_components.vaillant_plus import (
     async_setup_entry,
     async_unload_entry,
 )
-from custom_components.vaillant_plus.const import DISPATCHERS, DOMAIN, API_CLIENT
+from custom_components.vaillant_plus.const import (
+    API_CLIENT,
+    CONF_ENABLE_DEBUG_SENSORS,
+    CONF_TOKEN,
+    DISPATCHERS,
+    DOMAIN,
+    EVT_TOKEN_UPDATED,
+)
 
 from .const import (
     MOCK_CONFIG_ENTRY_DATA,
     MOCK_DEVICE_ATTRS_WHEN_CONNECT,
     MOCK_DEVICE_ATTRS_WHEN_UPDATE,
     MOCK_DID,
+    MOCK_USERNAME,
 )
 
 
@@ -118,3 +127,38 @@ async def test_init_setup_and_unload_entry(hass: HomeAssistant, bypass_login, by
             await hass.async_block_till_done()
             assert close_func.called
             assert config_entry.entry_id not in hass.data[DOMAIN][API_CLIENT]
+
+
+async def test_init_reload_on_options_update(
+    hass: HomeAssistant, bypass_login, bypass_get_device
+):
+    """Test only option changes reload the entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG_ENTRY_DATA, entry_id=MOCK_DID
+    )
+    config_entry.add_to_hass(hass)
+
+    with patch("vaillant_plus_cn_api.VaillantWebsocketClient.connect"):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        with patch.object(hass.config_entries, "async_reload") as reload_func:
+            # a token refresh only updates the entry data
+            async_dispatcher_send(
+                hass,
+                EVT_TOKEN_UPDATED.format(MOCK_USERNAME),
+                Token("a1", MOCK_USERNAME, "p1", access_token="new_token"),
+            )
+            await hass.async_block_till_done()
+            assert config_entry.data[CONF_TOKEN] != MOCK_CONFIG_ENTRY_DATA[CONF_TOKEN]
+            reload_func.assert_not_called()
+
+            hass.config_entries.async_update_entry(
+                config_entry, options={CONF_ENABLE_DEBUG_SENSORS: True}
+            )
+            await hass.async_block_till_done()
+            reload_func.assert_called_once_with(config_entry.entry_id)
+
+        with patch("custom_components.vaillant_plus.VaillantClient.close"):
+            assert await hass.config_entries.async_unload(config_entry.entry_id)
+            await hass.async_block_till_done()
@@ -0,0 +1,136 @@
+"""Test vaillant-plus sensor."""
+from unittest.mock import patch
+
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.vaillant_plus.const import (
+    CONF_DID,
+    CONF_ENABLE_DEBUG_SENSORS,
+    COORDINATOR,
+    DISPATCHERS,
+    DOMAIN,
+)
+from custom_components.vaillant_plus.entity import VaillantCoordinator
+from custom_components.vaillant_plus.sensor import (
+    SENSOR_DESCRIPTIONS,
+    VaillantSensorEntity,
+    _get_description,
+    async_setup_entry,
+)
+
+from .const import MOCK_DEVICE_ATTRS_WHEN_CONNECT, MOCK_DID
+
+
+async def test_sensor_tank_temperature(hass, device_api_client):
+    """Test sensor with a fahrenheit to celsius transform."""
+    sensor = VaillantSensorEntity(
+        VaillantCoordinator(hass, device_api_client),
+        _get_description("Tank_temperature"),
+    )
+
+    assert sensor.unique_id == "1_Tank_temperature"
+
+    assert sensor.update_from_latest_data({"Tank_temperature": 122})
+    assert sensor.native_value == 50
+    assert sensor.available is True
+
+    sensor.update_from_latest_data({})
+    assert sensor.native_value is None
+    assert sensor.available is False
+
+
+async def test_sensor_water_pressure(hass, device_api_client):
+    """Test sensor with a hex to bar transform."""
+    sensor = VaillantSensorEntity(
+        VaillantCoordinator(hass, device_api_client),
+        _get_description("reserved_data1"),
+    )
+
+    assert sensor.unique_id == "1_reserved_data1"
+
+    sensor.update_from_latest_data({"reserved_data1": "0F"})
+    assert sensor.native_value == 1.5
+    assert sensor.available is True
+
+    # malformed payloads make the sensor unavailable instead of raising
+    for invalid in ("zz", "", 15):
+        sensor.update_from_latest_data({"reserved_data1": "0F"})
+        sensor.update_from_latest_data({"reserved_data1": invalid})
+        assert sensor.native_value is None
+        assert sensor.available is False
+
+
+async def test_sensor_coordinator_update(hass, device_api_client):
+    """Test state is only written when the value changed."""
+    coordinator = VaillantCoordinator(hass, device_api_client)
+    sensor = VaillantSensorEntity(coordinator, _get_description("Room_Temperature"))
+
+    with patch.object(sensor, "async_write_ha_state") as write_state_func:
+        coordinator.data = {"Room_Temperature": 18.5}
+        sensor._handle_coordinator_update()
+        assert write_state_func.call_count == 1
+        assert sensor.native_value == 18.5
+
+        coordinator.data = {"Room_Temperature": 18.5, "Flow_temperature": 33.5}
+        sensor._handle_coordinator_update()
+        assert write_state_func.call_count == 1
+
+        coordinator.data = {"Room_Temperature": 20.5}
+        sensor._handle_coordinator_update()
+        assert write_state_func.call_count == 2
+        assert sensor.native_value == 20.5
+
+
+async def _async_setup_sensors(hass, device_api_client, entry):
+    """Set up the sensor platform and return the keys of added entities."""
+    coordinator = VaillantCoordinator(hass, device_api_client)
+    hass.data[DOMAIN] = {
+        COORDINATOR: {entry.entry_id: coordinator},
+        DISPATCHERS: {MOCK_DID: []},
+    }
+
+    added_entities: list[VaillantSensorEntity] = []
+    assert await async_setup_entry(hass, entry, added_entities.extend)
+
+    coordinator.async_set_updated_data(MOCK_DEVICE_ATTRS_WHEN_CONNECT)
+    await hass.async_block_till_done()
+
+    return [entity.entity_description.key for entity in added_entities]
+
+
+async def test_sensor_debug_sensors_disabled(hass, device_api_client):
+    """Test debug sensors are not added and removed from the registry."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_DID: MOCK_DID})
+    entry.add_to_hass(hass)
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create("sensor", DOMAIN, "1_reserved_data2")
+
+    keys = await _async_setup_sensors(hass, device_api_client, entry)
+
+    # entities are added in description order
+    assert keys == [key for key in SENSOR_DESCRIPTIONS if key in keys]
+    assert "Room_Temperature" in keys
+    assert "reserved_data1" in keys
+    assert not set(keys) & {"reserved_data2", "reserved_data3", "Maintenance"}
+    assert (
+        entity_registry.async_get_entity_id("sensor", DOMAIN, "1_reserved_data2")
+        is None
+    )
+
+
+async def test_sensor_debug_sensors_enabled(hass, device_api_client):
+    """Test debug sensors are added once enabled in the options flow."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_DID: MOCK_DID})
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_ENABLE_DEBUG_SENSORS: True},
+    )
+
+    keys = await _async_setup_sensors(hass, device_api_client, entry)
+
+    assert "Room_Temperature" in keys
+    assert {"reserved_data2", "reserved_data3", "Maintenance"} <= set(keys)
@@ -0,0 +1,242 @@
+"""Test vaillant-plus text."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.vaillant_plus.const import (
+    CONF_DID,
+    COORDINATOR,
+    DISPATCHERS,
+    DOMAIN,
+)
+from custom_components.vaillant_plus.entity import VaillantCoordinator
+from custom_components.vaillant_plus.text import (
+    VaillantTimeTextEntity,
+    _PendingWrites,
+    async_setup_entry,
+    encode_timeslots_from_list,
+    parse_display_string_to_slots,
+)
+
+from .const import MOCK_DID
+
+
+def test_parse_display_string_to_slots():
+    """Test parsing display strings."""
+    assert parse_display_string_to_slots("07:00-09:00, 18:00-22:00") == (
+        [(7, 0, 9, 0), (18, 0, 22, 0)],
+        "07:00-09:00, 18:00-22:00",
+    )
+    assert parse_display_string_to_slots(" 7:5 - 9:30 ,, ") == (
+        [(7, 5, 9, 30)],
+        "07:05-09:30",
+    )
+    assert parse_display_string_to_slots("7 : 00-9:00 , 018:00 - 22 :0") == (
+        [(7, 0, 9, 0), (18, 0, 22, 0)],
+        "07:00-09:00, 18:00-22:00",
+    )
+    assert parse_display_string_to_slots("0") == ([], "0")
+    assert parse_display_string_to_slots("") == ([], "0")
+    assert parse_display_string_to_slots(",,") == ([], "0")
+    assert parse_display_string_to_slots(" , ") == ([], "0")
+
+    # only the first 3 slots are kept
+    slots, _ = parse_display_string_to_slots("1:00-2:00," * 4)
+    assert len(slots) == 3
+
+    for invalid in ("07:00", "07-09", "07:00-09", "a:00-b:00", "24:00-01:00"):
+        with pytest.raises(ValueError):
+            parse_display_string_to_slots(invalid)
+
+
+def test_encode_timeslots_from_list():
+    """Test encoding slots to device hex."""
+    assert encode_timeslots_from_list([]) == "0" * 24
+    assert (
+        encode_timeslots_from_list([(7, 0, 9, 0), (18, 30, 23, 59)])
+        == "07000900121E173B00000000"
+    )
+
+
+async def test_text_update_from_latest_data(device_api_client):
+    """Test decoding device hex to display value."""
+    text = VaillantTimeTextEntity(device_api_client, "Start_Time_CH1", "CH Start Time 1")
+
+    assert text.unique_id == "1_Start_Time_CH1"
+
+    assert text.update_from_latest_data({"Start_Time_CH1": "07000900121E173B00000000"})
+    assert text.native_value == "07:00-09:00, 18:30-23:59"
+    assert text.available is True
+
+    # unchanged payload or display value doesn't need a state write
+    assert (
+        text.update_from_latest_data({"Start_Time_CH1": "07000900121E173B00000000"})
+        is False
+    )
+    assert (
+        text.update_from_latest_data({"Start_Time_CH1": "07000900121e173b00000000"})
+        is False
+    )
+
+    text.update_from_latest_data({"Start_Time_CH1": "000000000000000000000000"})
+    assert text.native_value == "0"
+
+    text.update_from_latest_data({"Start_Time_CH1": "not-a-hex-value-00000000"})
+    assert text.native_value is None
+    assert text.available is False
+
+
+async def test_text_set_value(device_api_client):
+    """Test writing a schedule from the UI."""
+    text = VaillantTimeTextEntity(device_api_client, "Start_Time_CH1", "CH Start Time 1")
+    text.update_from_latest_data({"Start_Time_CH1": "07000900121E173B00000000"})
+
+    with patch(
+        "custom_components.vaillant_plus.VaillantClient.control_device",
+        return_value=True,
+    ) as send_command_func, patch.object(text, "async_write_ha_state"):
+        # unchanged value is not sent to the device
+        await text.async_set_value("7:00-9:00, 18:30-23:59")
+        send_command_func.assert_not_awaited()
+        assert text.native_value == "07:00-09:00, 18:30-23:59"
+
+        await text.async_set_value("06:00-08:00")
+        send_command_func.assert_awaited_once_with(
+            {"Start_Time_CH1": "060008000000000000000000"}
+        )
+        assert text.native_value == "06:00-08:00"
+
+        # clearing all slots
+        send_command_func.reset_mock()
+        await text.async_set_value(" 0 ")
+        send_command_func.assert_awaited_once_with(
+            {"Start_Time_CH1": "000000000000000000000000"}
+        )
+        assert text.native_value == "0"
+
+        # invalid input is rejected
+        send_command_func.reset_mock()
+        await text.async_set_value("06:00")
+        send_command_func.assert_not_awaited()
+        assert text.native_value == "0"
+
+
+async def test_text_set_value_coalesced(hass, device_api_client):
+    """Test writes from several days are sent in one call."""
+    pending_writes = _PendingWrites(hass, device_api_client, delay=0)
+    monday = VaillantTimeTextEntity(
+        device_api_client, "Start_Time_CH1", "CH Start Time 1", pending_writes
+    )
+    tuesday = VaillantTimeTextEntity(
+        device_api_client, "Start_Time_CH2", "CH Start Time 2", pending_writes
+    )
+
+    with patch(
+        "custom_components.vaillant_plus.VaillantClient.control_device",
+        return_value=True,
+    ) as send_command_func, patch.object(
+        monday, "async_write_ha_state"
+    ), patch.object(
+        tuesday, "async_write_ha_state"
+    ):
+        await asyncio.gather(
+            monday.async_set_value("06:00-08:00"),
+            tuesday.async_set_value("0"),
+        )
+        send_command_func.assert_awaited_once_with(
+            {
+                "Start_Time_CH1": "060008000000000000000000",
+                "Start_Time_CH2": "000000000000000000000000",
+            }
+        )
+        assert monday.native_value == "06:00-08:00"
+        assert tuesday.native_value == "0"
+
+
+async def test_text_set_value_overrides_pending_write(hass, device_api_client):
+    """Test setting the device value back while a write is still queued."""
+    pending_writes = _PendingWrites(hass, device_api_client, delay=0)
+    text = VaillantTimeTextEntity(
+        device_api_client, "Start_Time_CH1", "CH Start Time 1", pending_writes
+    )
+    text.update_from_latest_data({"Start_Time_CH1": "07000900121E173B00000000"})
+
+    with patch(
+        "custom_components.vaillant_plus.VaillantClient.control_device",
+        return_value=True,
+    ) as send_command_func, patch.object(text, "async_write_ha_state"):
+        await asyncio.gather(
+            text.async_set_value("06:00-08:00"),
+            text.async_set_value("07:00-09:00, 18:30-23:59"),
+        )
+        # the last input wins
+        send_command_func.assert_awaited_once_with(
+            {"Start_Time_CH1": "07000900121E173B00000000"}
+        )
+        assert text.native_value == "07:00-09:00, 18:30-23:59"
+
+
+async def test_text_set_value_overrides_inflight_write(hass, device_api_client):
+    """Test setting the device value back while a write is still in flight."""
+    text = VaillantTimeTextEntity(device_api_client, "Start_Time_CH1", "CH Start Time 1")
+    text.update_from_latest_data({"Start_Time_CH1": "070009000000000000000000"})
+    release = asyncio.Event()
+
+    async def control_device(attrs):
+        if attrs["Start_Time_CH1"] == "060008000000000000000000":
+            await release.wait()
+        return True
+
+    with patch(
+        "custom_components.vaillant_plus.VaillantClient.control_device",
+        side_effect=control_device,
+    ) as send_command_func, patch.object(text, "async_write_ha_state"):
+        first_write = hass.async_create_task(text.async_set_value("06:00-08:00"))
+        await asyncio.sleep(0)
+
+        await text.async_set_value("07:00-09:00")
+        release.set()
+        await first_write
+
+        # the last input is sent and kept, the older result is ignored
+        assert send_command_func.await_count == 2
+        send_command_func.assert_awaited_with(
+            {"Start_Time_CH1": "070009000000000000000000"}
+        )
+        assert text.native_value == "07:00-09:00"
+
+
+async def test_text_discovery(hass, device_api_client):
+    """Test entities are added for keys reported after the first snapshot."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_DID: MOCK_DID})
+    coordinator = VaillantCoordinator(hass, device_api_client)
+    hass.data[DOMAIN] = {
+        COORDINATOR: {entry.entry_id: coordinator},
+        DISPATCHERS: {MOCK_DID: []},
+    }
+
+    added_entities: list[VaillantTimeTextEntity] = []
+    assert await async_setup_entry(hass, entry, added_entities.extend)
+
+    # an empty snapshot is skipped
+    coordinator.async_set_updated_data({})
+    assert added_entities == []
+
+    coordinator.async_set_updated_data({"Start_Time_CH2": "0" * 24, "DSN": 1500})
+    assert [e.unique_id for e in added_entities] == ["1_Start_Time_CH2"]
+
+    # keys missing from the first snapshot get their entities later
+    coordinator.async_set_updated_data(
+        {
+            "Start_Time_CH3": "0" * 24,
+            "Start_Time_CH2": "0" * 24,
+            "Start_Time_CH1": "0" * 24,
+        }
+    )
+    assert [e.unique_id for e in added_entities] == [
+        "1_Start_Time_CH2",
+        "1_Start_Time_CH1",
+        "1_Start_Time_CH3",
+    ]